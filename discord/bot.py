@@ -2,7 +2,10 @@ from __future__ import annotations
 
 import asyncio
 import collections
+import hashlib
 import inspect
+import json
+import logging
 import traceback
 from .commands.errors import CheckFailure
 
@@ -12,6 +15,7 @@ from typing import (
     Coroutine,
     List,
     Optional,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -21,7 +25,7 @@ import sys
 
 from .client import Client
 from .shard import AutoShardedClient
-from .utils import MISSING, get, find, async_all
+from .utils import MISSING, async_all, maybe_coroutine
 from .commands import (
     SlashCommand,
     SlashCommandGroup,
@@ -40,149 +44,337 @@ from .enums import InteractionType
 CoroFunc = Callable[..., Coroutine[Any, Any, Any]]
 CFT = TypeVar('CFT', bound=CoroFunc)
 
+_log = logging.getLogger(__name__)
+
+_APP_INTERACTION_TYPES = frozenset({InteractionType.application_command, InteractionType.auto_complete})
+
+# ApplicationCommandMixin._application_commands is keyed by the command ID as an
+# int. Discord sends IDs as strings, so register_commands stores ApplicationCommand.id
+# as an int and lookups convert with int() before touching the dict.
+
 __all__ = (
     'ApplicationCommandMixin',
     'Bot',
     'AutoShardedBot',
 )
 
+# Fields Discord adds to the commands it returns that are never part of a payload we send
+_SERVER_COMMAND_FIELDS = frozenset({"id", "application_id", "version", "guild_id"})
+
+# Fields Discord leaves out of the commands it returns while they hold these defaults
+_OMITTED_DEFAULTS = {
+    "required": (False,),
+    "choices": ([],),
+    "options": ([],),
+    "channel_types": ([],),
+    "name_localizations": ({},),
+    "description_localizations": ({},),
+}
+
+def _normalize_command(payload):
+    # Drop null values and the defaults Discord omits on both sides before
+    # comparing; any other false value is significant and kept.
+    if isinstance(payload, dict):
+        return {
+            k: _normalize_command(v)
+            for k, v in payload.items()
+            if k not in _SERVER_COMMAND_FIELDS and v is not None and v not in _OMITTED_DEFAULTS.get(k, ())
+        }
+    if isinstance(payload, list):
+        return [_normalize_command(v) for v in payload]
+    return payload
+
+def _commands_digest(commands) -> bytes:
+    normalized = []
+    for payload in commands:
+        payload = _normalize_command(payload)
+        payload.setdefault("type", 1)
+        normalized.append(payload)
+    normalized.sort(key=lambda c: (c["name"], c["type"]))
+    return hashlib.blake2b(json.dumps(normalized, sort_keys=True).encode(), digest_size=16).digest()
+
 class ApplicationCommandMixin:
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self._pending_application_commands = []
         self._application_commands = {}
+        # Secondary index of _application_commands: name -> {id: command}
+        self._application_commands_by_name = {}
+        self._application_commands_cache = None
+        self._register_commands_task = None
+        self._application_commands_digest = None
+        # Guilds that were sent command permission overwrites by the last sync,
+        # None until the first sync finishes
+        self._guilds_with_overwrites = None
+        # Guilds that were sent guild commands by the last sync, None until the
+        # first sync finishes
+        self._guilds_with_commands = None
 
     @property
     def pending_application_commands(self):
         return self._pending_application_commands
     
     @property
-    def commands(self) -> List[Union[ApplicationCommand, Any]]:
+    def commands(self) -> Tuple[Union[ApplicationCommand, Any], ...]:
         commands = self.application_commands
         if self._supports_prefixed_commands:
-            commands += self.prefixed_commands
+            return commands + tuple(self.prefixed_commands)
         return commands
     
     @property
-    def application_commands(self) -> List[ApplicationCommand]:
-        return list(self._applcation_commands.values())
+    def application_commands(self) -> Tuple[ApplicationCommand, ...]:
+        # Rebuilt lazily after _store_application_command/remove_application_command
+        if self._application_commands_cache is None:
+            self._application_commands_cache = tuple(self._application_commands.values())
+        return self._application_commands_cache
     
     def add_application_command(self, command: ApplicationCommand) -> None:
         if self.debug_guilds and command.guild_ids is None:
             command.guild_ids = self.debug_guilds
+
         self._pending_application_commands.append(command)
     
 
+    def _store_application_command(self, command: ApplicationCommand) -> None:
+        command_id = int(command.id)
+        previous = self._application_commands.get(command_id)
+        if previous is not None:
+            self._application_commands_by_name.get(previous.name, {}).pop(command_id, None)
+        self._application_commands[command_id] = command
+        self._application_commands_by_name.setdefault(command.name, {})[command_id] = command
+        self._application_commands_cache = None
+
     def remove_application_command(self, command: ApplicationCommand) -> Optional[ApplicationCommand]:
-        return self._application_commands.pop(command.id)
+        command_id = int(command.id)
+        self._application_commands_by_name.get(command.name, {}).pop(command_id, None)
+        self._application_commands_cache = None
+        return self._application_commands.pop(command_id)
     
     @property
     def get_command(self):
         return self.get_application_command
 
     def get_application_command(self, name: str, guild_ids: Optional[List[int]] = None, type: Type[ApplicationCommand] = SlashCommand,) -> Optional[ApplicationCommand]:
-        for command in self._application_commands.values():
-            if(command.name == name and isinstance(command, type)):
-                if guild_ids is not None and command.guild_ids != guild_ids:
-                    return
+        for command in self._application_commands_by_name.get(name, {}).values():
+            if isinstance(command, type) and (guild_ids is None or command.guild_ids == guild_ids):
                 return command
     
     async def sync_commands(self) -> None:
         raise NotImplementedError
     
-    async def register_commands(self) -> None:
+    async def register_commands(self, *, force: bool = False) -> None:
+        # Reconnects across shards can trigger this several times at once; let
+        # concurrent callers share the registration that is already running.
+        task = self._register_commands_task
+        if force:
+            # A running sync may return early on an unchanged digest, so let it
+            # finish and start a forced one instead of joining it
+            while task is not None and not task.done():
+                await asyncio.wait((task,))
+                task = self._register_commands_task
+        if task is None or task.done():
+            task = self._register_commands_task = asyncio.ensure_future(self._register_commands(force=force))
+        # Shielded so one cancelled caller does not cancel the sync for the others
+        return await asyncio.shield(task)
+
+    @staticmethod
+    def _classify_permissions(command: ApplicationCommand) -> None:
+        # Classify and serialize the permissions once per sync so the guild sync
+        # does not refilter or re-serialize them per guild, and the digest hashes
+        # exactly what is sent
+        perm_global = []
+        perm_by_guild = collections.defaultdict(list)
+        for perm in command.permissions:
+            if perm.guild_id is None:
+                perm_global.append(perm.to_dict())
+            elif command.guild_ids is None or perm.guild_id in command.guild_ids:
+                perm_by_guild[perm.guild_id].append(perm.to_dict())
+        command._perm_global = perm_global
+        command._perm_by_guild = perm_by_guild
+
+    @staticmethod
+    def _serialize_commands(global_commands, guild_commands, permission_guild_ids):
+        global_dicts = [c.to_dict() for c in global_commands]
+        guild_dicts = [c.to_dict() for c in guild_commands]
+        state = [
+            global_dicts,
+            [c.guild_ids for c in guild_commands],
+            guild_dicts,
+            [(c._perm_global, c._perm_by_guild) for c in global_commands + guild_commands],
+            permission_guild_ids,
+        ]
+        digest = hashlib.blake2b(
+            json.dumps(state, sort_keys=True, default=str).encode(), digest_size=16
+        ).hexdigest()
+        return global_dicts, guild_dicts, digest
+
+    async def _register_commands(self, *, force: bool = False) -> None:
+        # Partition the pending commands in a single pass, indexing them so the
+        # commands Discord sends back can be resolved to their pending objects.
+        global_commands, guild_commands = [], []
+        global_index, guild_index = {}, {}
+        for cmd in self.pending_application_commands:
+            self._classify_permissions(cmd)
+            if cmd.guild_ids is None:
+                global_commands.append(cmd)
+                global_index[(cmd.name, cmd.type)] = cmd
+            else:
+                guild_commands.append(cmd)
+                for gid in cmd.guild_ids:
+                    guild_index[(cmd.name, cmd.type, gid)] = cmd
+
         commands = []
 
-        # Global Command Permissions
-        global_permissions: List = []
+        # Unscoped global permissions are sent to every guild the bot is in, so
+        # joining a guild has to invalidate the digest as well
+        if any(cmd._perm_global for cmd in global_commands):
+            permission_guild_ids = sorted(guild.id for guild in self.guilds)
+        else:
+            permission_guild_ids = None
+
+        # Serializing a large command tree can stall the event loop, so do it in
+        # the default executor while the registered commands are being fetched.
+        serialize_task = self.loop.run_in_executor(
+            None, self._serialize_commands, global_commands, guild_commands, permission_guild_ids
+        )
+
+        # Nothing changed since the last successful sync (e.g. a reconnect), so
+        # the commands registered with Discord are still current.
+        if not force and self._application_commands_digest is not None:
+            _, _, digest = await serialize_task
+            if digest == self._application_commands_digest:
+                return
 
         registered_commands = await self.http.get_global_commands(self.user.id)
-        for command in [
-            cmd for cmd in self.pending_application_commands if cmd.guild_ids is None
-        ]:
-            as_dict = command.to_dict()
-            if len(registered_commands) > 0:
-                matches = [
-                    x
-                    for x in registered_commands
-                    if x["name"] == command.name and x["type"] == command.type
-                ]
-                # TODO: rewrite this, it seems inefficient
-                if matches:
-                    as_dict["id"] = matches[0]["id"]
-            commands.append(as_dict)
-
-        cmds = await self.http.bulk_upsert_global_commands(self.user.id, commands)
+        global_dicts, guild_dicts, digest = await serialize_task
+        # Keep the first match per (name, type), same as the old linear scan did
+        registered_by_key = {}
+        for x in registered_commands:
+            registered_by_key.setdefault((x["name"], x["type"]), x["id"])
+
+        for cmd, payload in zip(global_commands, global_dicts):
+            rid = registered_by_key.get((cmd.name, cmd.type))
+            if rid is not None:
+                # Copy rather than patch the serialized payload in place
+                payload = {**payload, "id": rid}
+            commands.append(payload)
+
+        # Discord already has exactly these global commands, reuse what it returned
+        if _commands_digest(commands) == _commands_digest(registered_commands):
+            cmds = registered_commands
+        else:
+            cmds = await self.http.bulk_upsert_global_commands(self.user.id, commands)
+
+        # Global Command Permissions, serialized once here. The ones without a
+        # guild apply to every guild; the rest are bucketed by the guild they
+        # target. Roles are converted to IDs per guild just before the upsert.
+        global_unscoped = {}
+        global_by_guild = collections.defaultdict(dict)
 
         for i in cmds:
-            cmd = get(
-                self.pending_application_commands,
-                name=i["name"],
-                guild_ids=None,
-                type=i["type"],
-            )
-            cmd.id = i["id"]
-            self._application_commands[cmd.id] = cmd
-
-            # Permissions (Roles will be converted to IDs just before Upsert for Global Commands)
-            global_permissions.append({"id": i["id"], "permissions": cmd.permissions})
-
-        update_guild_commands = {}
-        async for guild in self.fetch_guilds(limit=None):
-            update_guild_commands[guild.id] = []
-        for command in [
-            cmd
-            for cmd in self.pending_application_commands
-            if cmd.guild_ids is not None
-        ]:
-            as_dict = command.to_dict()
-            for guild_id in command.guild_ids:
-                to_update = update_guild_commands[guild_id]
-                update_guild_commands[guild_id] = to_update + [as_dict]
-
-        for guild_id, guild_data in update_guild_commands.items():
-            try:
-                cmds = await self.http.bulk_upsert_guild_commands(
-                    self.user.id, guild_id, update_guild_commands[guild_id]
-                )
+            cmd = global_index[(i["name"], i["type"])]
+            cmd.id = int(i["id"])
+            self._store_application_command(cmd)
+
+            global_unscoped[i["id"]] = cmd._perm_global
+            for perm_guild_id, perms in cmd._perm_by_guild.items():
+                global_by_guild[perm_guild_id][i["id"]] = perms
+
+        # Only guilds that pending commands target get their commands synced
+        update_guild_commands = collections.defaultdict(list)
+        for cmd, payload in zip(guild_commands, guild_dicts):
+            for guild_id in cmd.guild_ids:
+                update_guild_commands[guild_id].append(payload)
+
+        # Guilds that had guild commands on the last sync but have none now get
+        # an empty upload, which deletes their stale commands. A forced sync does
+        # the same for every cached guild without pending commands, which also
+        # removes commands left behind before a restart.
+        guild_targets = dict(update_guild_commands)
+        stale_guild_ids = set(self._guilds_with_commands or ())
+        if force:
+            stale_guild_ids.update(guild.id for guild in self.guilds)
+        for guild_id in stale_guild_ids:
+            guild_targets.setdefault(guild_id, [])
+
+        # Global command permissions still have to reach every guild they apply
+        # to. Those guilds only take part in the permission phase; None tells
+        # _sync_guild there are no guild commands to upload there.
+        for guild_id in global_by_guild:
+            guild_targets.setdefault(guild_id, None)
+        for guild_id in permission_guild_ids or ():
+            guild_targets.setdefault(guild_id, None)
+
+        # Guilds that were sent overwrites last time are revisited so overwrites
+        # removed from the code get cleared. A forced sync already visits every
+        # cached guild above, which also clears overwrites left before a restart.
+        previous_overwrites = self._guilds_with_overwrites
+        for guild_id in previous_overwrites or ():
+            guild_targets.setdefault(guild_id, None)
+
+        # Owner permissions need the application info; fetch it at most once and
+        # let concurrently syncing guilds share the in-flight request.
+        owner_ids_task = None
+
+        async def _fetch_owner_ids():
+            app = await self.application_info()  # type: ignore
+            if app.team:
+                return [m.id for m in app.team.members]
+            return [app.owner.id]
+
+        async def _owner_ids():
+            nonlocal owner_ids_task
+            if owner_ids_task is None:
+                owner_ids_task = asyncio.ensure_future(_fetch_owner_ids())
+            return await owner_ids_task
+
+        # Bound the number of guilds synced at once so large bots do not
+        # burst through the rate limits.
+        guild_sync_semaphore = asyncio.Semaphore(16)
+
+        async def _sync_guild(guild_id, guild_data):
+            async with guild_sync_semaphore:
+                if guild_data is None:
+                    cmds = ()
+                else:
+                    try:
+                        cmds = await self.http.bulk_upsert_guild_commands(
+                            self.user.id, guild_id, guild_data
+                        )
+                    except Forbidden:
+                        if not guild_data and self.get_guild(guild_id) is None:
+                            # Clearing a guild the bot has left; there is nothing to retry
+                            return
+                        # Missing access to one guild should not stop the others syncing
+                        _log.error("Failed to add command to guild %s", guild_id)
+                        # Nothing was synced here, so revisit it next time
+                        guilds_with_commands.add(guild_id)
+                        guilds_with_overwrites.add(guild_id)
+                        return True
+
+                    if guild_data:
+                        guilds_with_commands.add(guild_id)
 
                 # Permissions for this Guild
                 guild_permissions: List = []
-            except Forbidden:
-                if not guild_data:
-                    continue
-                print(f"Failed to add command to guild {guild_id}", file=sys.stderr)
-                raise
-            else:
+                # Built on the first role-name permission for this guild
+                role_by_name = None
+
                 for i in cmds:
-                    cmd = find(lambda cmd: cmd.name == i["name"] and cmd.type == i["type"] and int(i["guild_id"]) in cmd.guild_ids, self.pending_application_commands)
-                    cmd.id = i["id"]
-                    self._application_commands[cmd.id] = cmd
+                    cmd = guild_index[(i["name"], i["type"], int(i["guild_id"]))]
+                    cmd.id = int(i["id"])
+                    self._store_application_command(cmd)
 
                     # Permissions
-                    permissions = [
-                        perm.to_dict()
-                        for perm in cmd.permissions
-                        if perm.guild_id is None
-                        or (
-                            perm.guild_id == guild_id and perm.guild_id in cmd.guild_ids
-                        )
-                    ]
+                    permissions = cmd._perm_global + cmd._perm_by_guild.get(guild_id, [])
                     guild_permissions.append(
                         {"id": i["id"], "permissions": permissions}
                     )
 
-                for global_command in global_permissions:
-                    permissions = [
-                        perm.to_dict()
-                        for perm in global_command["permissions"]
-                        if perm.guild_id is None
-                        or (
-                            perm.guild_id == guild_id and perm.guild_id in cmd.guild_ids
-                        )
-                    ]
+                scoped = global_by_guild.get(guild_id, {})
+                for cmd_id, permissions in global_unscoped.items():
                     guild_permissions.append(
-                        {"id": global_command["id"], "permissions": permissions}
+                        {"id": cmd_id, "permissions": permissions + scoped.get(cmd_id, [])}
                     )
 
                 # Collect & Upsert Permissions for Each Guild
@@ -192,20 +384,28 @@ class ApplicationCommandMixin:
                 # Loop through Commands Permissions available for this Guild
                 for item in guild_permissions:
                     new_cmd_perm = {"id": item["id"], "permissions": []}
+                    resolved = new_cmd_perm["permissions"]
+                    # Discord allows at most 10 overwrites per command, stop once reached
+                    truncated = False
 
                     # Replace Role / Owner Names with IDs
                     for permission in item["permissions"]:
+                        if len(resolved) >= 10:
+                            truncated = True
+                            break
+
                         if isinstance(permission["id"], str):
                             # Replace Role Names
                             if permission["type"] == 1:
-                                role = get(
-                                    self.get_guild(guild_id).roles,
-                                    name=permission["id"],
-                                )
+                                if role_by_name is None:
+                                    # Role names resolve to the first matching role, like utils.get
+                                    guild_obj = self.get_guild(guild_id)
+                                    role_by_name = {r.name: r for r in reversed(guild_obj.roles)} if guild_obj else {}
+                                role = role_by_name.get(permission["id"])
 
                                 # If not missing
                                 if role is not None:
-                                    new_cmd_perm["permissions"].append(
+                                    resolved.append(
                                         {
                                             "id": role.id,
                                             "type": 1,
@@ -213,70 +413,109 @@ class ApplicationCommandMixin:
                                         }
                                     )
                                 else:
-                                    print(
-                                        "No Role ID found in Guild ({guild_id}) for Role ({role})".format(
-                                            guild_id=guild_id, role=permission["id"]
-                                        )
+                                    _log.warning(
+                                        "No Role ID found in Guild (%s) for Role (%s)", guild_id, permission["id"]
                                     )
                             # Add owner IDs
                             elif (
                                 permission["type"] == 2 and permission["id"] == "owner"
                             ):
-                                app = await self.application_info()  # type: ignore
-                                if app.team:
-                                    for m in app.team.members:
-                                        new_cmd_perm["permissions"].append(
-                                            {
-                                                "id": m.id,
-                                                "type": 2,
-                                                "permission": permission["permission"],
-                                            }
-                                        )
-                                else:
-                                    new_cmd_perm["permissions"].append(
-                                        {
-                                            "id": app.owner.id,
-                                            "type": 2,
-                                            "permission": permission["permission"],
-                                        }
-                                    )
+                                owner_ids = await _owner_ids()
+                                room = 10 - len(resolved)
+                                if len(owner_ids) > room:
+                                    truncated = True
+                                resolved.extend(
+                                    {
+                                        "id": owner_id,
+                                        "type": 2,
+                                        "permission": permission["permission"],
+                                    }
+                                    for owner_id in owner_ids[:room]
+                                )
                         # Add the rest
                         else:
-                            new_cmd_perm["permissions"].append(permission)
-
-                    # Make sure we don't have over 10 overwrites
-                    if len(new_cmd_perm["permissions"]) > 10:
-                        print(
-                            "Command '{name}' has more than 10 permission overrides in guild ({guild_id}).\nwill only use the first 10 permission overrides.".format(
-                                name=self._application_commands[new_cmd_perm["id"]].name,
-                                guild_id=guild_id,
-                            )
+                            resolved.append(permission)
+
+                    if truncated:
+                        _log.warning(
+                            "Command %r has more than 10 permission overrides in guild (%s); "
+                            "will only use the first 10 permission overrides.",
+                            self._application_commands[int(new_cmd_perm["id"])].name,
+                            guild_id,
                         )
-                        new_cmd_perm["permissions"] = new_cmd_perm["permissions"][:10]
 
                     # Append to guild_cmd_perms
                     guild_cmd_perms.append(new_cmd_perm)
 
-                # Upsert
+                # No commands here at all
+                if not guild_cmd_perms:
+                    return
+
+                # Nothing to overwrite in this guild, save the round-trip. This is
+                # only safe when the last sync left no overwrites there, so it is
+                # not done on the first sync or on a forced one.
+                has_overwrites = any(item["permissions"] for item in guild_cmd_perms)
+                if (
+                    not has_overwrites
+                    and not force
+                    and previous_overwrites is not None
+                    and guild_id not in previous_overwrites
+                ):
+                    return
+
+                # Upserted once every guild's commands are in place
+                perm_batches.append((guild_id, guild_cmd_perms, has_overwrites))
+
+        async def _upsert_permissions(guild_id, guild_cmd_perms, has_overwrites):
+            async with perm_semaphore:
                 try:
                     await self.http.bulk_upsert_command_permissions(
                         self.user.id, guild_id, guild_cmd_perms
                     )
                 except Forbidden:
-                    print(
-                        f"Failed to add command permissions to guild {guild_id}",
-                        file=sys.stderr,
-                    )
-                    raise
+                    # One guild refusing permissions should not abort the others
+                    _log.error("Failed to add command permissions to guild %s", guild_id)
+                    # Its old overwrites may still be in place, so revisit it
+                    guilds_with_overwrites.add(guild_id)
+                    return True
+                else:
+                    if has_overwrites:
+                        guilds_with_overwrites.add(guild_id)
+
+        perm_batches: List = []
+        guilds_with_commands = set()
+        guilds_with_overwrites = set()
+        results = await asyncio.gather(
+            *(_sync_guild(guild_id, guild_data) for guild_id, guild_data in guild_targets.items()),
+            return_exceptions=True,
+        )
+
+        perm_semaphore = asyncio.Semaphore(8)
+        results += await asyncio.gather(
+            *(_upsert_permissions(*batch) for batch in perm_batches),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        self._guilds_with_commands = guilds_with_commands
+        self._guilds_with_overwrites = guilds_with_overwrites
+        # _sync_guild and _upsert_permissions return True when a guild refused an
+        # upsert. Keep no digest then, so the next sync retries that guild.
+        self._application_commands_digest = None if any(results) else digest
+
     async def process_application_commands(self, interaction: Interaction) -> None:
-        if interaction.type not in (InteractionType.application_command, InteractionType.auto_complete):
+        t = interaction.type
+        if t not in _APP_INTERACTION_TYPES:
             return
+        cmd_id = int(interaction.data["id"])
         try:
-            command = self._application_commands[interaction.data["id"]]
+            command = self._application_commands[cmd_id]
         except KeyError:
             self.dispatch("unknown_command", interaction)
         else:
-            if interaction.type is InteractionType.auto_complete:
+            if t == InteractionType.auto_complete:
                 return await command.invoke_autocomplete_callback(interaction)
 
             ctx = await self.get_application_context(interaction)
@@ -331,7 +570,7 @@ class BotBase(ApplicationCommandMixin, CogMixin):
         # super(Client, self).__init__(*args, **kwargs)
         # I replaced ^ with v and it worked
         super().__init__(*args, **options)
-        self.extra_events = {}  # TYPE: Dict[str, List[CoroFunc]]
+        self.extra_events = collections.defaultdict(list)  # TYPE: Dict[str, List[CoroFunc]]
         self.__cogs = {}  # TYPE: Dict[str, Cog]
         self.__extensions = {}  # TYPE: Dict[str, types.ModuleType]
         self._checks = []  # TYPE: List[Check]
@@ -341,6 +580,8 @@ class BotBase(ApplicationCommandMixin, CogMixin):
         self.description = inspect.cleandoc(description) if description else ""
         self.owner_id = options.get("owner_id")
         self.owner_ids = options.get("owner_ids", set())
+        # Run independent checks concurrently instead of one after another
+        self.parallel_checks = options.get("parallel_checks", False)
 
         self.debug_guild = options.pop(
             "debug_guild", None
@@ -416,19 +657,19 @@ class BotBase(ApplicationCommandMixin, CogMixin):
 
         if len(data) == 0:
             return True
+
+        if self.parallel_checks:
+            return all(await asyncio.gather(*(maybe_coroutine(f, ctx) for f in data)))
         
         return await async_all(f(ctx) for f in data)
 
     def add_listener(self, func: CoroFunc, name: str = MISSING) -> None:
         name = func.__name__ if name is MISSING else name
 
-        if not asyncio.iscoroutinefunction(func):
+        if not inspect.iscoroutinefunction(func):
             raise TypeError('Listeners must be coroutines')
 
-        if name in self.extra_events:
-            self.extra_events[name].append(func)
-        else:
-            self.extra_events[name] = [func]
+        self.extra_events[name].append(func)
         
     def remove_listeners(self, func: CoroFunc, name: str = MISSING) -> None:
         name = func.__name__ if name is MISSING else name
@@ -448,18 +689,19 @@ class BotBase(ApplicationCommandMixin, CogMixin):
     def dispatch(self, event_name: str, *args: Any, **kwargs: Any) -> None:
         super().dispatch(event_name, *args, **kwargs)
         ev = 'on_' + event_name
-        for event in self.extra_events.get(ev, []):
+        # get() so that dispatching an event nobody listens to does not add a key
+        for event in self.extra_events.get(ev) or ():
             self._scheduled_event(event, ev, *args, **kwargs)
     
     def before_invoke(self, coro):
-        if not asyncio.iscoroutinefunction(coro):
+        if not inspect.iscoroutinefunction(coro):
             raise TypeError("The pre-invoke hook must be a coroutine.")
 
         self._before_invoke = coro
         return coro
     
     def after_invoke(self, coro):
-        if not asyncio.iscoroutinefunction(coro):
+        if not inspect.iscoroutinefunction(coro):
             raise TypeError("The post-invoke hook must be a coroutine.")
         
         self._after_invoke = coro
@@ -3,10 +3,9 @@ from __future__ import annotations
 import asyncio
 from asyncio.exceptions import CancelledError
 import types
-import functools
 import inspect
-from collections import OrderedDict
-from typing import Any, Callable, Dict, List, Optional, Union
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from typing_extensions import Required
 
 from ..enums import SlashCommandOptionType, ChannelType
@@ -14,7 +13,7 @@ from ..member import Member
 from ..user import User
 from ..message import Message
 from .context import ApplicationContext
-from ..utils import find, get_or_fetch, async_all
+from ..utils import find, get_or_fetch, maybe_coroutine
 from ..errors import ValidationError, ClientException
 from .errors import ApplicationCommandError, CheckFailure, ApplicationCommandInvokeError
 from .permissions import Permission, has_role, has_any_role, is_user, is_owner, permission
@@ -47,44 +46,76 @@ __all__ = (
     "permission",
 )
 
-def wrap_callback(coro):
-    @functools.wraps(coro)
-    async def wrapped(*args, **kwargs):
-        try:
-            ret = await coro(*args, **kwargs)
-        except ApplicationCommandError:
-            raise
-        except asyncio.CancelledError:
-            return
-        except Exception as exc:
-            raise ApplicationCommandInvokeError(exc) from exc
-        return ret
-    return wrapped
+# Option type values compared on every slash command invocation
+_USER_VAL = SlashCommandOptionType.user.value
+_ROLE_VAL = SlashCommandOptionType.role.value
+_MENTIONABLE = SlashCommandOptionType.mentionable
+_STRING = SlashCommandOptionType.string
+
+# PEP 604 unions (X | Y) are types.UnionType instances on Python 3.10+
+_UNION_ORIGINS = (Union,) + ((types.UnionType,) if hasattr(types, "UnionType") else ())
+
+# Parsed callback signatures keyed by id() of the callback. Each entry is dropped
+# when its callback is garbage collected, so a recycled id() never hits it.
+_SIG_CACHE: Dict[int, Dict[str, inspect.Parameter]] = {}
+
+async def _resolve_mention(guild, attr: Optional[str], arg_id: int):
+    # attr is None for mentionable options, which may be a member or a role
+    if attr is not None:
+        return await get_or_fetch(guild, attr, arg_id, default=arg_id)
+
+    arg = await get_or_fetch(guild, "member", arg_id)
+    if arg is None:
+        arg = guild.get_role(arg_id) or arg_id
+    return arg
+
+class _WrappedCallback:
+    # Invoked once per error dispatch, so it skips the cost of functools.wraps
+    __slots__ = ("coro",)
+
+    def __init__(self, coro):
+        self.coro = coro
 
-def hooked_wrapped_callback(command, ctx, coro):
-    @functools.wraps(coro)
-    async def wrapped(arg):
+    async def __call__(self, *args, **kwargs):
         try:
-            ret = await coro(arg)
+            ret = await self.coro(*args, **kwargs)
         except ApplicationCommandError:
             raise
         except asyncio.CancelledError:
             return
         except Exception as exc:
             raise ApplicationCommandInvokeError(exc) from exc
-        finally:
-            await command.call_after_hooks(ctx)
         return ret
-    return wrapped  
+
+def wrap_callback(coro):
+    return _WrappedCallback(coro)
 
 class _BaseCommand:
     __slots__ = ()
 
 class ApplicationCommand(_BaseCommand):
-    cog = None
+    _cog = None
+    _before_invoke = None
+    _after_invoke = None
+    # Overridden cog hooks, resolved when the command is bound to a cog
+    _cog_before_hook = None
+    _cog_after_hook = None
+    _cog_error_hook = None
+    # Serialized permissions split by the bot on each sync: the unscoped ones
+    # and the guild-scoped ones keyed by guild ID. Replaced, never mutated.
+    _perm_global: List[Dict] = []
+    _perm_by_guild: Dict[int, List[Dict]] = {}
+    # Whether a command or cog local hook is set, so invocations without any
+    # hooks can skip call_before_hooks/call_after_hooks entirely
+    _has_before_hooks = False
+    _has_after_hooks = False
+    _repr = None
 
     def __repr__(self):
-        return f"<discord.commands.{self.__class__.__name__} name={self.name}>"
+        # Commands are not renamed after construction
+        if self._repr is None:
+            self._repr = f"<discord.commands.{self.__class__.__name__} name={self.name}>"
+        return self._repr
 
     def __eq__(self, other):
         return isinstance(other, self.__class__)
@@ -98,13 +129,25 @@ class ApplicationCommand(_BaseCommand):
         if not await self.can_run(ctx):
             raise CheckFailure(f'The check functions for the command {self.name} failed')
         
-        await self.call_before_hooks(ctx)
+        if self._has_before_hooks or ctx.bot._before_invoke is not None:
+            await self.call_before_hooks(ctx)
     
     async def invoke(self, ctx: ApplicationContext) -> None:
         await self.prepare(ctx)
+        await self._invoke_with_hooks(ctx)
 
-        injected = hooked_wrapped_callback(self, ctx, self._invoke)
-        await injected(ctx)
+    async def _invoke_with_hooks(self, ctx: ApplicationContext) -> None:
+        try:
+            await self._invoke(ctx)
+        except ApplicationCommandError:
+            raise
+        except asyncio.CancelledError:
+            return
+        except Exception as exc:
+            raise ApplicationCommandInvokeError(exc) from exc
+        finally:
+            if self._has_after_hooks or ctx.bot._after_invoke is not None:
+                await self.call_after_hooks(ctx)
 
     async def can_run(self, ctx: ApplicationContext) -> bool:
 
@@ -114,8 +157,18 @@ class ApplicationCommand(_BaseCommand):
         predicates = self.checks
         if not predicates:
             return True
-        
-        return await async_all(predicate(ctx) for predicate in predicates)
+
+        if getattr(ctx.bot, "parallel_checks", False):
+            return all(await asyncio.gather(*(maybe_coroutine(predicate, ctx) for predicate in predicates)))
+
+        # Most checks are plain functions, so only await results that need it
+        for predicate in predicates:
+            result = predicate(ctx)
+            if inspect.isawaitable(result):
+                result = await result
+            if not result:
+                return False
+        return True
 
     async def dispatch_error(self, ctx: ApplicationContext, error: Exception) -> None:
         ctx.command_failed = True
@@ -132,19 +185,31 @@ class ApplicationCommand(_BaseCommand):
                 await injected(ctx, error)
         
         try:
-            if cog is not None:
-                local = cog.__class__._get_overridden_method(cog.cog_command_error)
-                if local is not None:
-                    wrapped = wrap_callback(local)
-                    await wrapped(ctx, error)
+            local = self._cog_error_hook
+            if local is not None:
+                wrapped = wrap_callback(local)
+                await wrapped(ctx, error)
         finally:
             ctx.bot.dispatch('application_command_error', ctx, error)
         
     def _get_signature_parameters(self):
-        return OrderedDict(inspect.signature(self.callback).parameters)
+        key = id(self.callback)
+        try:
+            return _SIG_CACHE[key]
+        except KeyError:
+            pass
+
+        params = dict(inspect.signature(self.callback).parameters)
+        try:
+            weakref.finalize(self.callback, _SIG_CACHE.pop, key, None)
+        except TypeError:
+            # Not weak-referenceable, so it cannot be evicted safely
+            return params
+        _SIG_CACHE[key] = params
+        return params
 
     def error(self, coro):
-        if not asyncio.iscoroutinefunction(coro):
+        if not inspect.iscoroutinefunction(coro):
             raise TypeError('The error handler must be a coroutine.')
         
         self.on_error = coro
@@ -154,19 +219,41 @@ class ApplicationCommand(_BaseCommand):
         return hasattr(self, 'on_error')
     
     def before_invoke(self, coro):
-        if not asyncio.iscoroutinefunction(coro):
+        if not inspect.iscoroutinefunction(coro):
             raise TypeError('The pre-invoke hook must be a coroutine.')
 
         self._before_invoke = coro
+        self._update_hook_flags()
         return coro
 
     def after_invoke(self, coro):
-        if not asyncio.iscoroutinefunction(coro):
+        if not inspect.iscoroutinefunction(coro):
             raise TypeError("The post-invoke hook must be a coroutine.")
 
         self._after_invoke = coro
+        self._update_hook_flags()
         return coro
 
+    @property
+    def cog(self):
+        return self._cog
+
+    @cog.setter
+    def cog(self, value) -> None:
+        self._cog = value
+        if value is not None:
+            get_overridden = value.__class__._get_overridden_method
+            self._cog_before_hook = get_overridden(value.cog_before_invoke)
+            self._cog_after_hook = get_overridden(value.cog_after_invoke)
+            self._cog_error_hook = get_overridden(value.cog_command_error)
+        else:
+            self._cog_before_hook = self._cog_after_hook = self._cog_error_hook = None
+        self._update_hook_flags()
+
+    def _update_hook_flags(self) -> None:
+        self._has_before_hooks = self._before_invoke is not None or self._cog_before_hook is not None
+        self._has_after_hooks = self._after_invoke is not None or self._cog_after_hook is not None
+
     async def call_before_hooks(self, ctx: ApplicationContext) -> None:
         cog = self.cog
         if self._before_invoke is not None:
@@ -176,10 +263,9 @@ class ApplicationCommand(_BaseCommand):
             else:
                 await self._before_invoke(ctx)
         
-        if cog is not None:
-            hook = cog.__class__._get_overridden_method(cog.cog_before_invoke)
-            if hook is not None:
-                await hook(ctx)
+        hook = self._cog_before_hook
+        if hook is not None:
+            await hook(ctx)
             
         hook = ctx.bot._before_invoke
         if hook is not None:
@@ -194,10 +280,9 @@ class ApplicationCommand(_BaseCommand):
             else:
                 await self._after_invoke(ctx)
         
-        if cog is not None:
-            hook = cog.__class__._get_overridden_method(ctx.cog_after_invoke)
-            if hook is not None:
-                await hook(ctx)
+        hook = self._cog_after_hook
+        if hook is not None:
+            await hook(ctx)
             
         hook = ctx.bot._after_invoke
         if hook is not None:
@@ -213,7 +298,7 @@ class SlashCommand(ApplicationCommand):
         return self
     
     def __init__(self, func: Callable, *args, **kwargs) -> None:
-        if not asyncio.iscoroutinefunction(func):
+        if not inspect.iscoroutinefunction(func):
             raise TypeError("Callback must be a coroutine")
         self.callback = func
 
@@ -232,9 +317,12 @@ class SlashCommand(ApplicationCommand):
         self.description: str = description
         self.is_subcommand: bool = False
         self.cog = None
+        self._dict_cache = None
 
         params = self._get_signature_parameters()
         self.options = self._parse_options(params)
+        self._options_by_name = {o.name: o for o in self.options}
+        self._defaults = {o.name: o.default for o in self.options}
 
         try:
             checks = func.__commands_checks__
@@ -255,16 +343,13 @@ class SlashCommand(ApplicationCommand):
 
 
     def _parse_options(self, params) -> List[Option]:
-        final_options = []
-
-        if list(params.items())[0][0] == "self":
-            temp = list(params.items())
-            temp.pop(0)
-            params = dict(temp)
         params = iter(params.items())
 
+        # Skip "self" (if present) and "ctx"
         try:
-            next(params)
+            first_name, _ = next(params)
+            if first_name == "self":
+                next(params)
         except StopIteration:
             raise ClientException(f'Callback for {self.name} command is missing "ctx" parameter.')
 
@@ -299,15 +384,17 @@ class SlashCommand(ApplicationCommand):
         return final_options
 
     def _is_typing_union(self, annotation):
-        return(
-            getattr(annotation, '__origin__', None) is Union
-            or type(annotation) is getattr(types, "UninonType", Union)
-        )
+        return getattr(annotation, '__origin__', None) is Union or type(annotation) in _UNION_ORIGINS
     
     def _is_typing_optional(self, annotation):
         return self._is_typing_union(annotation) and type(None) in annotation.__args__
 
     def to_dict(self) -> Dict:
+        # Built lazily at registration time, once a group has marked the command
+        # as a subcommand. Callers must copy the dict before modifying it.
+        if self._dict_cache is not None:
+            return self._dict_cache
+
         as_dict = {
             "name": self.name,
             "description": self.description,
@@ -317,6 +404,7 @@ class SlashCommand(ApplicationCommand):
         if self.is_subcommand:
             as_dict["type"] = SlashCommandOptionType.sub_command.value
 
+        self._dict_cache = as_dict
         return as_dict
 
     def __eq__(self, other) -> bool:
@@ -327,33 +415,39 @@ class SlashCommand(ApplicationCommand):
         )
 
     async def _invoke(self, ctx: ApplicationContext) -> None:
-        kwargs = {}
+        # Options the user left out keep their defaults
+        kwargs = self._defaults.copy()
+        # Mention targets may each need a fetch, so they are resolved together
+        # once the converters have run in order. Only (name, attr, id) is kept
+        # here; the coroutines are created when they are awaited, so a failing
+        # converter leaves none behind un-awaited.
+        resolving = []
         for arg in ctx.interaction.data.get("options", []):
-            op = find(lambda x: x.name == arg["name"], self.options)
+            op = self._options_by_name[arg["name"]]
             arg = arg["value"]
 
-            if(
-                SlashCommandOptionType.user.value
-                <= op.input_type.value
-                <= SlashCommandOptionType.role.value
-            ):
+            if _USER_VAL <= op._input_type_value <= _ROLE_VAL:
                 name = "member" if op.input_type.name == "user" else op.input_type.name
-                arg = await get_or_fetch(ctx.guild, name, int(arg), default=int(arg))
+                resolving.append((op.name, name, int(arg)))
+                continue
             
-            elif op.input_type == SlashCommandOptionType.mentionable:
-                arg_id = int(arg)
-                arg = await get_or_fetch(ctx.guild, "member", arg_id)
-                if arg is None:
-                    arg = ctx.guild.get_role(arg_id) or arg_id
+            elif op.input_type == _MENTIONABLE:
+                resolving.append((op.name, None, int(arg)))
+                continue
             
-            elif op.input_type == SlashCommandOptionType.string and op._converter is not None:
+            elif op.input_type == _STRING and op._converter is not None:
                 arg = await op._converter.convert(ctx, arg)
 
             kwargs[op.name] = arg 
-        
-        for o in self.options:
-            if o.name not in kwargs:
-                kwargs[o.name] = o.default
+
+        if len(resolving) == 1:
+            op_name, attr, arg_id = resolving[0]
+            kwargs[op_name] = await _resolve_mention(ctx.guild, attr, arg_id)
+        elif resolving:
+            results = await asyncio.gather(
+                *(_resolve_mention(ctx.guild, attr, arg_id) for _, attr, arg_id in resolving)
+            )
+            kwargs.update(zip((op_name for op_name, _, _ in resolving), results))
 
         if self.cog is not None:
             await self.callback(self.cog, ctx, **kwargs)
@@ -370,6 +464,7 @@ class SlashCommand(ApplicationCommand):
     def _ensure_assignment_on_copy(self, other):
         other._before_invoke = self._before_invoke
         other._after_invoke = self._after_invoke
+        other._update_hook_flags()
         if self.checks != other.checks:
             other.checks = self.checks.copy()
 
@@ -396,6 +491,21 @@ channel_type_map = {
 }
 
 class Option:
+    __slots__ = (
+        "name",
+        "description",
+        "_converter",
+        "channel_types",
+        "input_type",
+        "_input_type_value",
+        "required",
+        "choices",
+        "default",
+        "min_value",
+        "max_value",
+        "_dict_cache",
+    )
+
     def __init__(
         self, input_type: Any, /, description: str = None, **kwargs
     ) -> None:
@@ -420,11 +530,12 @@ class Option:
                         self.channel_types.append(channel_type)
                 input_type = _type
         self.input_type = input_type
+        self._input_type_value = input_type.value
         self.required: bool = kwargs.pop("required", True)
-        self.choices: List[OptionalChoice] = [
+        self.choices: Tuple[OptionalChoice, ...] = tuple(
             o if isinstance(o, OptionalChoice) else OptionalChoice(o)
-            for o in kwargs.pop("choices", list())
-        ]
+            for o in kwargs.pop("choices", ())
+        )
         self.default = kwargs.pop("default", None)
         if self.input_type == SlashCommandOptionType.integer:
             minmax_types = (int,)
@@ -432,16 +543,21 @@ class Option:
             minmax_types = (int, float)
         else:
             minmax_types = (type(None),)
-        minmax_typehint = Optional[Union[minmax_types]]
 
-        self.min_value: minmax_typehint = kwargs.pop("min_value", None)
-        self.max_value: minmax_typehint = kwargs.pop("max_value", None)
+        self.min_value: Optional[Union[int, float]] = kwargs.pop("min_value", None)
+        self.max_value: Optional[Union[int, float]] = kwargs.pop("max_value", None)
+        self._dict_cache = None
 
         if not (isinstance(self.min_value, minmax_types) or self.min_value is None):
-            raise TypeError(f"Expected {minmax_typehint} for min_value, got \"{type(self.min_value).__name__}\"")
-        if not (isinstance(self.max_value, minmax_types) or self.min_value is None):
-            raise TypeError(f"Expected {minmax_typehint} for max_value, got \"{type(self.max_value).__name__}\"")
+            raise TypeError(f"Expected Optional[{'|'.join(t.__name__ for t in minmax_types)}] for min_value, got \"{type(self.min_value).__name__}\"")
+        if not (isinstance(self.max_value, minmax_types) or self.max_value is None):
+            raise TypeError(f"Expected Optional[{'|'.join(t.__name__ for t in minmax_types)}] for max_value, got \"{type(self.max_value).__name__}\"")
     def to_dict(self) -> Dict:
+        # Filled on first use, which is after _parse_options has finished
+        # setting the name, default and required flag
+        if self._dict_cache is not None:
+            return self._dict_cache
+
         as_dict = {
             "name": self.name,
             "description": self.description,
@@ -456,18 +572,26 @@ class Option:
         if self.max_value is not None:
             as_dict["max_value"] = self.max_value
 
+        self._dict_cache = as_dict
         return as_dict
     
     def __repr__(self):
-        return f"<discord.commands.{self._class__.__name__} name={self.name}>"
+        return f"<discord.commands.{self.__class__.__name__} name={self.name}>"
 
 class OptionalChoice:
+    __slots__ = ("name", "value", "_cached_dict")
+
     def __init__(self, name: str, value: Optional[Union[str, int, float]] = None):
         self.name = name
         self.value = value or name
+        self._cached_dict = None
 
     def to_dict(self) -> Dict[str, Union[str, int, float]]:
-        return {"name": self.name, "value": self.value}
+        # Choices are not modified after construction, so serialize once
+        d = self._cached_dict
+        if d is None:
+            d = self._cached_dict = {"name": self.name, "value": self.value}
+        return d
 
 def option(name, type=None, **kwargs):
     def decor(func):
@@ -559,7 +683,7 @@ class ContextMenuCommand(ApplicationCommand):
         return self
     
     def __init__(self, func: Callable, *args, **kwargs) -> None:
-        if not asyncio.iscoroutinefunction(func):
+        if not inspect.iscoroutinefunction(func):
             raise TypeError("Callback must be a coroutine")
         self.callback = func
 
@@ -587,15 +711,12 @@ class ContextMenuCommand(ApplicationCommand):
         self.permissions = []
 
     def validate_parameters(self):
-        params = self._get_signature_parameters()
-        if list(params.items())[0][0] == "self":
-            temp = list(params.items())
-            temp.pop(0)
-            params = dict(temp)
-        params = iter(params)
+        params = iter(self._get_signature_parameters())
 
+        # Skip "self" (if present) and "ctx"
         try:
-            next(params)
+            if next(params) == "self":
+                next(params)
         except StopIteration:
             raise ClientException(f'Callback for {self.name} command is missing "ctx" parameter.')
         
@@ -657,6 +778,7 @@ class UserCommand(ContextMenuCommand):
     def _ensure_assignment_on_copy(self, other):
         other._before_invoke = self._before_invoke
         other._after_invoke = self._after_invoke
+        other._update_hook_flags()
         if self.checks != other.checks:
             other.checks = self.checks.copy()
 
@@ -708,6 +830,7 @@ class MessageCommand(ContextMenuCommand):
     def _ensure_assignment_on_copy(self, other):
         other._before_invoke = self._before_invoke
         other._after_invoke = self._after_invoke
+        other._update_hook_flags()
         if self.checks != other.checks:
             other.checks = self.checks.copy()
         
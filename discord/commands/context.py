@@ -14,6 +14,9 @@ from ..user import User
 from ..utils import cached_property
 
 class ApplicationContext(discord.abc.Messageable):
+    # __dict__ stays for the cached properties and attributes set later on
+    __slots__ = ("bot", "interaction", "command", "_state", "__dict__")
+
     def __init__(self, bot: "discord.Bot", interaction: Interaction):
         self.bot = bot
         self.interaction = interaction
@@ -9,4 +9,8 @@ class CheckFailure(ApplicationCommandError):
 class ApplicationCommandInvokeError(ApplicationCommandError):
     def __init__(self, e: Exception) -> None:
         self.original: Exception = e
-        super().__init__(f'Application Command rasied an exception: {e.__class__.__name__}: {e}')
\ No newline at end of file
+        # The message is only built when needed since str(e) can be expensive
+        super().__init__(e)
+
+    def __str__(self) -> str:
+        return f'Application Command raised an exception: {self.original.__class__.__name__}: {self.original}'
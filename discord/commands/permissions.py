@@ -3,15 +3,26 @@ from typing import Union, Dict, Callable
 __all__ = ("Permission", "has_role", "has_any_role", "is_user", "is_owner", "permission")
 
 class Permission:
+    __slots__ = ("id", "type", "permission", "guild_id", "_cached_dict")
+
     def __init__(self, id: Union[int, str], type: int, permission: bool = True, guild_id: int = None):
         self.id = id
         self.type = type
         self.permission = permission
         self.guild_id = guild_id
+        self._cached_dict = None
 
     def to_dict(self) -> Dict[str, Union[int, bool]]:
-        return {"id": self.id, "type": self.type, "permission": self.permission}
+        # Permissions are not modified after construction, so serialize once
+        d = self._cached_dict
+        if d is None:
+            d = self._cached_dict = {"id": self.id, "type": self.type, "permission": self.permission}
+        return d
     
+def _attach(func: Callable, *perms: Permission) -> Callable:
+    func.__dict__.setdefault('__app_cmd_perms__', []).extend(perms)
+    return func
+
 def permission(role_id: int = None, user_id: int = None, permission: bool = True, guild_id: int = None):
     def decorator(func: Callable):
         if not role_id is None:
@@ -21,59 +32,26 @@ def permission(role_id: int = None, user_id: int = None, permission: bool = True
         else:
             raise ValueError("role_id or user_id must be specified!")
 
-        if not hasattr(func, '__app_cm_perms__'):
-            func.__app_cmd_perms__ = []
-
-        func.__app_cmd_perms__.append(app_cmd_perm)
-
-        return func
+        return _attach(func, app_cmd_perm)
 
     return decorator
 
 def has_role(item: Union[int, str], guild_id: int = None):
     def decorator(func: Callable):
-        if not hasattr(func, '__app_cmd_perms__'):
-            func.__app_cmd_perms__ = []
-
-            app_cmd_perm = Permission(item, 1, True, guild_id)
-
-            func.__app_cmd_perms__.append(app_cmd_perm)
-
-        return func
+        return _attach(func, Permission(item, 1, True, guild_id))
     return decorator
 
 def has_any_role(*items: Union[int, str], guild_id: int = None):
     def decorator(func: Callable):
-        if not hasattr(func, '__app_cmd_perms__'):
-            func.__app_cmd_perms__ = []
-
-        for item in items:
-            app_cmd_perm = Permission(item, 1, True, guild_id)
-
-            func.__app_cmd_perms__.append(app_cmd_perm)
-        return func
+        return _attach(func, *[Permission(item, 1, True, guild_id) for item in items])
     return decorator
 
 def is_user(user: int, guild_id: int = None):
     def decorator(func: Callable):
-        if not hasattr(func, '__app_cmd_perms__'):
-            func.__app_cmd_perms__ = []
-
-            app_cmd_perm = Permission(user, 2, True, guild_id)
-
-            func.__app_cmd_perms__.append(app_cmd_perm)
-
-        return func
+        return _attach(func, Permission(user, 2, True, guild_id))
     return decorator
 
 def is_owner(guild_id: int = None):
     def decorator(func: Callable):
-        if not hasattr(func, '__app_cmd_perms__'):
-            func.__app_cmd_perms__ = []
-
-        app_cmd_perm = Permission("owner", 2, True, guild_id)
-
-        func.__app_cmd_perms__.append(app_cmd_perm)
-
-        return func
+        return _attach(func, Permission("owner", 2, True, guild_id))
     return decorator